@@ -4,8 +4,9 @@ Configuration loader for declarative schemas.
 Loads YAML/JSON configurations and converts them to schema objects.
 """
 
+import copy
 import json
-import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Dict, List
 from .schemas.corpus_schema import (
@@ -18,6 +19,22 @@ from .schemas.automation_schema import (
 )
 
 
+@lru_cache(maxsize=128)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse a YAML configuration file.
+
+    Cached on (path, mtime, size) so unchanged files are only read and
+    parsed once.
+    """
+    # Imported lazily so JSON-only callers never pay for PyYAML; prefer the
+    # libyaml-backed loader when it was compiled in.
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=loader)
+
+
 class ConfigLoader:
     """
     Loads and validates declarative configurations.
@@ -27,19 +44,32 @@ class ConfigLoader:
 
     @staticmethod
     def load_file(path: Union[str, Path]) -> Dict:
-        """Load configuration from file."""
-        path = Path(path)
+        """
+        Load configuration from file.
 
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {path}")
+        The format is taken from the suffix of the path as given. YAML
+        parses are cached per file version; JSON is parsed directly, since
+        json.load is already cheaper than the cache bookkeeping.
+        """
+        path = Path(path)
 
-        with open(path, 'r', encoding='utf-8') as f:
-            if path.suffix in ['.yaml', '.yml']:
-                return yaml.safe_load(f)
-            elif path.suffix == '.json':
-                return json.load(f)
-            else:
-                raise ValueError(f"Unsupported file format: {path.suffix}")
+        try:
+            if path.suffix == '.json':
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration file not found: {path}"
+            ) from None
+
+        if path.suffix not in ['.yaml', '.yml']:
+            raise ValueError(f"Unsupported file format: {path.suffix}")
+
+        # Hand out a copy so callers can't mutate the cached parse result
+        return copy.deepcopy(
+            _parse_yaml(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        )
 
     @staticmethod
     def save_file(config: Dict, path: Union[str, Path]) -> None:
@@ -48,6 +78,7 @@ class ConfigLoader:
 
         with open(path, 'w', encoding='utf-8') as f:
             if path.suffix in ['.yaml', '.yml']:
+                import yaml
                 yaml.safe_dump(config, f, default_flow_style=False)
             elif path.suffix == '.json':
                 json.dump(config, f, indent=2)
@@ -4,8 +4,10 @@ Declarative schema for automation rules.
 Defines rules for automatic processing, scheduling, and workflows.
 """
 
+import dataclasses
+import operator
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable
 from enum import Enum
 
 
@@ -27,6 +29,19 @@ class ActionType(Enum):
     CLEANUP = "cleanup"
 
 
+# Condition operators, resolved once per Condition rather than per evaluation
+CONDITION_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'gt': operator.gt,
+    'lt': operator.lt,
+    'gte': operator.ge,
+    'lte': operator.le,
+    'in': lambda actual, expected: actual in expected,
+    'contains': operator.contains,
+}
+
+
 @dataclass
 class Condition:
     """A condition that must be met for a rule to execute."""
@@ -34,6 +49,23 @@ class Condition:
     operator: str  # eq, ne, gt, lt, gte, lte, in, contains
     value: Any
     type: str = "simple"  # simple, compound
+    # Qualified, since the ``field`` attribute above shadows the helper here
+    _op: Callable[[Any, Any], bool] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Resolve the operator name to its comparison function."""
+        try:
+            self._op = CONDITION_OPERATORS[self.operator]
+        except KeyError:
+            raise ValueError(
+                f"Unknown condition operator: {self.operator}"
+            ) from None
+
+    def evaluate(self, context: Dict) -> bool:
+        """Check the condition against the value of its field in context."""
+        return self._op(context[self.field], self.value)
 
 
 @dataclass
@@ -51,6 +83,10 @@ class TriggerConfig:
     # For threshold triggers
     conditions: List[Condition] = field(default_factory=list)
 
+    def conditions_met(self, context: Dict) -> bool:
+        """Check whether every trigger condition holds for context."""
+        return all(c.evaluate(context) for c in self.conditions)
+
 
 @dataclass
 class ActionConfig:
@@ -4,10 +4,16 @@ Functional ML transformations and feature engineering.
 Emphasizes pure, composable transformation functions.
 """
 
-from typing import List, Callable, TypeVar, Union
-import numpy as np
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Callable, Optional, TypeVar, Union
 from dataclasses import dataclass
 
+# NumPy is imported inside the functions that need it so that importing
+# Transform/compose_transforms stays cheap on cold start.
+if TYPE_CHECKING:
+    import numpy as np
+
 T = TypeVar('T')
 
 
@@ -23,26 +29,89 @@ class Transform:
         return self.transform_fn(data, self.params)
 
 
-def normalize(data: np.ndarray, params: dict = None) -> np.ndarray:
+def _mean_std(data: np.ndarray):
+    """
+    Per-column mean and standard deviation from fused first/second moments.
+
+    The moments are taken around the first row rather than zero, so the
+    variance does not cancel catastrophically when the mean is large
+    relative to the spread. Accumulation is in float64 regardless of the
+    input dtype.
+    """
+    import numpy as np
+
+    n = data.shape[0]
+    pivot = data[0] if n else np.zeros(data.shape[1:])
+    shifted = np.subtract(data, pivot, dtype=np.float64)
+    s1 = np.sum(shifted, axis=0)
+    s2 = np.einsum('i...,i...->...', shifted, shifted)
+    offset = s1 / n
+    mean = pivot + offset
+    std = np.sqrt(np.maximum(s2 / n - offset * offset, 0.0)) + 1e-8
+    return mean, std
+
+
+def _output_buffer(
+    data: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    inplace: bool = False
+) -> np.ndarray:
+    """Pick the array a scaling op writes into."""
+    import numpy as np
+
+    if inplace:
+        return data
+    if out is not None:
+        return out
+    dtype = data.dtype if np.issubdtype(data.dtype, np.floating) else np.float32
+    return np.empty(data.shape, dtype=dtype)
+
+
+def normalize(
+    data: np.ndarray,
+    params: dict = None,
+    *,
+    out: Optional[np.ndarray] = None,
+    inplace: bool = False
+) -> np.ndarray:
     """
     Normalize data to zero mean and unit variance.
     If params provided, use those; otherwise calculate from data.
+
+    Pass ``out`` to write into a preallocated array, or ``inplace=True``
+    to overwrite ``data`` itself (which must then be a floating array).
     """
+    import numpy as np
+
+    data = np.asarray(data)
     if params is None:
-        mean = np.mean(data, axis=0)
-        std = np.std(data, axis=0) + 1e-8
+        mean, std = _mean_std(data)
     else:
         mean = params['mean']
         std = params['std']
 
-    return (data - mean) / std
+    result = _output_buffer(data, out, inplace)
+    np.subtract(data, mean, out=result, casting='same_kind')
+    np.divide(result, std, out=result, casting='same_kind')
+    return result
 
 
-def min_max_scale(data: np.ndarray, params: dict = None) -> np.ndarray:
+def min_max_scale(
+    data: np.ndarray,
+    params: dict = None,
+    *,
+    out: Optional[np.ndarray] = None,
+    inplace: bool = False
+) -> np.ndarray:
     """
     Scale data to [0, 1] range.
     If params provided, use those; otherwise calculate from data.
+
+    Accepts ``out`` and ``inplace`` with the same meaning as ``normalize``.
     """
+    import numpy as np
+
+    data = np.asarray(data)
     if params is None:
         min_val = np.min(data, axis=0)
         max_val = np.max(data, axis=0)
@@ -51,7 +120,10 @@ def min_max_scale(data: np.ndarray, params: dict = None) -> np.ndarray:
         max_val = params['max']
 
     range_val = max_val - min_val + 1e-8
-    return (data - min_val) / range_val
+    result = _output_buffer(data, out, inplace)
+    np.subtract(data, min_val, out=result, casting='same_kind')
+    np.divide(result, range_val, out=result, casting='same_kind')
+    return result
 
 
 def vectorize(texts: List[str], vocabulary: dict = None) -> np.ndarray:
@@ -59,18 +131,31 @@ def vectorize(texts: List[str], vocabulary: dict = None) -> np.ndarray:
     Convert texts to bag-of-words vectors.
     If vocabulary provided, use it; otherwise build from texts.
     """
+    import numpy as np
+
+    tokenized = [text.split() for text in texts]
+
     if vocabulary is None:
         # Build vocabulary
-        words = set()
-        for text in texts:
-            words.update(text.split())
+        words = {word for tokens in tokenized for word in tokens}
         vocabulary = {word: idx for idx, word in enumerate(sorted(words))}
 
-    vectors = np.zeros((len(texts), len(vocabulary)))
-    for i, text in enumerate(texts):
-        for word in text.split():
-            if word in vocabulary:
-                vectors[i, vocabulary[word]] += 1
+    # Flatten (document, word) hits into index arrays and scatter-add them
+    # in a single NumPy call instead of a per-token Python loop.
+    lookup = vocabulary.get
+    rows: List[int] = []
+    cols: List[int] = []
+    for i, tokens in enumerate(tokenized):
+        ids = [idx for idx in map(lookup, tokens) if idx is not None]
+        cols.extend(ids)
+        rows.extend([i] * len(ids))
+
+    vectors = np.zeros((len(texts), len(vocabulary)), dtype=np.float32)
+    np.add.at(
+        vectors,
+        (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)),
+        1
+    )
 
     return vectors
 
@@ -83,11 +168,11 @@ def learn_transform(
     """
     Learn transformation parameters from data and return immutable Transform.
     """
+    import numpy as np
+
     if transform_fn == normalize:
-        params = {
-            'mean': np.mean(data, axis=0),
-            'std': np.std(data, axis=0) + 1e-8
-        }
+        mean, std = _mean_std(np.asarray(data))
+        params = {'mean': mean, 'std': std}
     elif transform_fn == min_max_scale:
         params = {
             'min': np.min(data, axis=0),
@@ -99,8 +184,52 @@ def learn_transform(
     return Transform(name=name, params=params, transform_fn=transform_fn)
 
 
+def _affine_terms(transform: Transform):
+    """
+    Return ``(shift, divisor)`` when ``transform`` is a learned per-column
+    ``(x - shift) / divisor`` map, otherwise None.
+    """
+    params = transform.params
+    if not params:
+        return None
+    if transform.transform_fn is normalize:
+        return params['mean'], params['std']
+    if transform.transform_fn is min_max_scale:
+        return params['min'], params['max'] - params['min'] + 1e-8
+    return None
+
+
 def compose_transforms(*transforms: Transform) -> Callable:
-    """Compose multiple transforms into a single function."""
+    """
+    Compose multiple transforms into a single function.
+
+    Chains made up only of learned normalize/min_max_scale transforms are
+    folded into one per-column affine map, so data is swept once rather
+    than once per step.
+    """
+    terms = [_affine_terms(transform) for transform in transforms]
+    if len(terms) > 1 and all(term is not None for term in terms):
+        import numpy as np
+
+        # Fold the chain into (x - shift) * scale with float64 coefficients.
+        # Subtracting first lets the large terms cancel before the result
+        # is rounded to the output dtype.
+        scale = np.ones((), dtype=np.float64)
+        offset = np.zeros((), dtype=np.float64)
+        for shift, divisor in terms:
+            divisor = np.asarray(divisor, dtype=np.float64)
+            scale = scale / divisor
+            offset = (offset - np.asarray(shift, dtype=np.float64)) / divisor
+        total_shift = -offset / scale
+
+        def fused(data):
+            data = np.asarray(data)
+            result = _output_buffer(data)
+            np.subtract(data, total_shift, out=result, casting='same_kind')
+            np.multiply(result, scale, out=result, casting='same_kind')
+            return result
+        return fused
+
     def composed(data):
         result = data
         for transform in transforms:
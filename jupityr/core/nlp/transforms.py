@@ -4,12 +4,43 @@ Functional NLP transformations.
 Pure functions for text processing, tokenization, and feature extraction.
 """
 
-from typing import List, Dict, Callable, Iterable
-from functools import partial
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Callable, Iterable, Optional, Pattern
+from functools import lru_cache
+import os
+import pickle
 import re
+import warnings
+
+
+@lru_cache(maxsize=128)
+def _compile(pattern: str) -> Pattern:
+    """Compile a regex pattern once and reuse it across calls."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=128)
+def _punctuation_pattern(keep: str) -> Pattern:
+    """Compiled pattern matching punctuation not listed in keep."""
+    return re.compile(f"[^\\w\\s{re.escape(keep)}]")
+
+
+@lru_cache(maxsize=128)
+def _punctuation_table(keep: str) -> Dict[int, Optional[int]]:
+    """str.translate table deleting the ASCII punctuation not listed in keep."""
+    pattern = _punctuation_pattern(keep)
+    return str.maketrans(
+        '', '', ''.join(c for c in map(chr, range(128)) if pattern.match(c))
+    )
+
+
+# Size of the memoization caches on the whole-text cleaning functions
+TEXT_CACHE_SIZE = 16384
 
 
 # Pure text transformation functions
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
 def normalize_text(text: str) -> str:
     """Normalize text to lowercase and remove extra whitespace."""
     return ' '.join(text.lower().split())
@@ -17,26 +48,77 @@ def normalize_text(text: str) -> str:
 
 def remove_punctuation(text: str, keep: str = "") -> str:
     """Remove punctuation except characters in keep."""
-    pattern = f"[^\\w\\s{re.escape(keep)}]"
-    return re.sub(pattern, '', text)
+    if text.isascii():
+        return text.translate(_punctuation_table(keep))
+    return _punctuation_pattern(keep).sub('', text)
 
 
 def tokenize(text: str, pattern: str = r'\w+') -> List[str]:
     """Tokenize text using regex pattern."""
-    return re.findall(pattern, text)
+    return _compile(pattern).findall(text)
 
 
 def ngrams(tokens: List[str], n: int) -> List[tuple]:
     """Generate n-grams from tokens."""
-    return [tuple(tokens[i:i+n]) for i in range(len(tokens) - n + 1)]
-
-
-def word_frequencies(tokens: List[str]) -> Dict[str, int]:
+    if n < 1:
+        return [tuple(tokens[i:i+n]) for i in range(len(tokens) - n + 1)]
+    return list(zip(*(tokens[i:] for i in range(n))))
+
+
+def ngrams_ids(ids, n: int):
+    """
+    Generate n-grams over integer token IDs.
+
+    Returns a read-only ``(len(ids) - n + 1, n)`` NumPy view onto ids
+    rather than a list of tuples, so no per-n-gram objects are allocated.
+    """
+    import numpy as np
+
+    ids = np.asarray(ids)
+    if len(ids) < n:
+        return np.empty((0, n), dtype=ids.dtype)
+    return np.lib.stride_tricks.sliding_window_view(ids, n)
+
+
+def ngram_counts(ids, n: int):
+    """
+    Count distinct n-grams over integer token IDs.
+
+    Returns ``(grams, counts)``: a ``(k, n)`` array of the distinct n-grams
+    in lexicographic order and how often each one occurs. Counting happens
+    entirely in NumPy, without building an n-gram tuple per window.
+    """
+    import numpy as np
+
+    windows = ngrams_ids(ids, n)
+    if len(windows) == 0:
+        return windows.copy(), np.zeros(0, dtype=np.intp)
+    if n < 1:
+        return np.unique(windows, axis=0, return_counts=True)
+
+    base = int(windows.max()) + 1
+    if windows.min() < 0 or base ** n > np.iinfo(np.int64).max:
+        return np.unique(windows, axis=0, return_counts=True)
+
+    # Pack each window into one exact mixed-radix int64 key, count the keys,
+    # then unpack the distinct keys back into n-gram rows. The range check
+    # above makes the int64 cast lossless, and keeps unsigned IDs from
+    # promoting the keys to float64.
+    packed = windows.astype(np.int64, copy=False)
+    keys = np.zeros(len(windows), dtype=np.int64)
+    for column in range(n):
+        keys = keys * base + packed[:, column]
+    keys, counts = np.unique(keys, return_counts=True)
+
+    grams = np.empty((len(keys), n), dtype=windows.dtype)
+    for column in range(n - 1, -1, -1):
+        keys, grams[:, column] = np.divmod(keys, base)
+    return grams, counts
+
+
+def word_frequencies(tokens: List[str]) -> 'Counter[str]':
     """Calculate word frequencies from tokens."""
-    freq = {}
-    for token in tokens:
-        freq[token] = freq.get(token, 0) + 1
-    return freq
+    return Counter(tokens)
 
 
 # Higher-order functions for text processing
@@ -50,20 +132,86 @@ def text_pipeline(*transforms: Callable[[str], str]) -> Callable[[str], str]:
     return pipeline
 
 
-def batch_transform(transform: Callable[[str], any]) -> Callable[[Iterable[str]], List[any]]:
-    """Convert a single-text transform to a batch transform."""
+def batch_transform(
+    transform: Callable[[str], any],
+    *,
+    n_process: Optional[int] = None,
+    chunk_size: int = 256,
+    threaded: bool = False
+) -> Callable[[Iterable[str]], List[any]]:
+    """
+    Convert a single-text transform to a batch transform.
+
+    With ``n_process`` greater than 1 the batch is spread over a process
+    pool (``-1`` uses every CPU), handing ``chunk_size`` texts to a worker
+    at a time. Set ``threaded=True`` to use a thread pool instead, which
+    only helps when the transform releases the GIL; it uses every CPU
+    unless ``n_process`` says otherwise. Transforms that cannot be pickled
+    fall back to serial processing with a warning.
+    """
+    if n_process is None:
+        n_process = -1 if threaded else 1
+    if n_process == 0 or n_process < -1:
+        raise ValueError(
+            f"n_process must be a positive integer or -1, got {n_process}"
+        )
+    workers = os.cpu_count() if n_process == -1 else n_process
+
+    if workers != 1 and not threaded:
+        try:
+            pickle.dumps(transform)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            warnings.warn(
+                f"{getattr(transform, '__qualname__', transform)} cannot be "
+                "pickled; running batch_transform serially",
+                RuntimeWarning
+            )
+            workers = 1
+
     def batch_fn(texts: Iterable[str]) -> List[any]:
-        return [transform(text) for text in texts]
+        if workers == 1:
+            return [transform(text) for text in texts]
+        if threaded:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(transform, texts))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(transform, texts, chunksize=chunk_size))
     return batch_fn
 
 
 # Common NLP pipelines
-basic_clean = text_pipeline(
-    normalize_text,
-    partial(remove_punctuation, keep="'-")
-)
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def basic_clean(text: str) -> str:
+    """
+    Normalize whitespace and case, then strip punctuation other than ' and -.
+
+    A module-level function rather than a text_pipeline closure, so it can
+    be pickled and handed to batch_transform's process pool.
+    """
+    return remove_punctuation(normalize_text(text), keep="'-")
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _standard_tokens(text: str) -> tuple:
+    """Cached, immutable result of standard_tokenize."""
+    return tuple(
+        _compile(r'\w+').findall(remove_punctuation(text.lower(), keep="'-"))
+    )
 
 
 def standard_tokenize(text: str) -> List[str]:
-    """Standard tokenization pipeline."""
-    return tokenize(basic_clean(text))
+    """
+    Standard tokenization pipeline.
+
+    Equivalent to ``tokenize(basic_clean(text))``, but skips the whitespace
+    normalization pass since word tokenization ignores whitespace anyway.
+    Results are memoized, so repeated texts are only tokenized once.
+    """
+    return list(_standard_tokens(text))
+
+
+def clear_caches() -> None:
+    """Drop memoized results of normalize_text, basic_clean and standard_tokenize."""
+    normalize_text.cache_clear()
+    basic_clean.cache_clear()
+    _standard_tokens.cache_clear()
@@ -6,7 +6,7 @@ Inspired by toolz and functional programming principles.
 """
 
 from typing import Callable, TypeVar, Iterable, Any
-from functools import reduce, wraps
+from functools import partial, reduce, wraps
 import operator
 
 A = TypeVar('A')
@@ -18,7 +18,16 @@ def compose(*functions: Callable) -> Callable:
     Compose functions right to left.
     compose(f, g, h)(x) == f(g(h(x)))
     """
-    return reduce(lambda f, g: lambda x: f(g(x)), functions, lambda x: x)
+    if len(functions) == 1:
+        return functions[0]
+
+    functions = functions[::-1]
+
+    def composed(x):
+        for func in functions:
+            x = func(x)
+        return x
+    return composed
 
 
 def pipe(data: A, *functions: Callable) -> Any:
@@ -26,23 +35,44 @@ def pipe(data: A, *functions: Callable) -> Any:
     Pipe data through a series of functions left to right.
     pipe(x, f, g, h) == h(g(f(x)))
     """
-    return reduce(lambda acc, func: func(acc), functions, data)
+    for func in functions:
+        data = func(data)
+    return data
 
 
 def curry(func: Callable) -> Callable:
     """
     Simple currying decorator for functions.
     """
+    arity = func.__code__.co_argcount
+
     @wraps(func)
     def curried(*args, **kwargs):
-        if len(args) + len(kwargs) >= func.__code__.co_argcount:
+        if not kwargs:
+            if len(args) >= arity:
+                return func(*args)
+        elif len(args) + len(kwargs) >= arity:
             return func(*args, **kwargs)
-        return lambda *more_args, **more_kwargs: curried(
-            *(args + more_args), **{**kwargs, **more_kwargs}
-        )
+        return partial(curried, *args, **kwargs)
     return curried
 
 
+def _specialize(transforms: tuple) -> Callable[[Any], Any]:
+    """
+    Generate a straight-line function applying transforms in order.
+
+    Transforms are fixed for the lifetime of a pipeline, so the loop over
+    them is unrolled once at construction time.
+    """
+    namespace = {f"_t{i}": transform for i, transform in enumerate(transforms)}
+    source = "def _run(x):\n" + "".join(
+        f"    x = _t{i}(x)\n" for i in range(len(transforms))
+    ) + "    return x\n"
+    exec(source, namespace)
+    run: Callable[[Any], Any] = namespace['_run']
+    return run
+
+
 class Pipeline:
     """
     Immutable pipeline for data transformations.
@@ -50,15 +80,29 @@ class Pipeline:
 
     def __init__(self, *transforms: Callable):
         self._transforms = transforms
+        self._run = _specialize(transforms)
 
     def __call__(self, data: Any) -> Any:
         """Execute the pipeline on data."""
-        return pipe(data, *self._transforms)
+        return self._run(data)
+
+    def as_function(self) -> Callable[[Any], Any]:
+        """
+        Return the pipeline as a plain function.
+
+        Calling it directly skips the method dispatch of ``__call__``,
+        which is useful when the pipeline is applied in a tight loop.
+        """
+        return self._run
 
     def then(self, transform: Callable) -> 'Pipeline':
         """Add a transformation to the pipeline (returns new pipeline)."""
         return Pipeline(*self._transforms, transform)
 
+    def __reduce__(self):
+        # The generated runner can't be pickled; rebuild it on load instead
+        return (Pipeline, self._transforms)
+
     def __repr__(self) -> str:
         return f"Pipeline({len(self._transforms)} transforms)"
 
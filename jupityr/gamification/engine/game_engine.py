@@ -4,27 +4,51 @@ Game engine for managing gamification logic.
 Central coordinator for player progression, achievements, and challenges.
 """
 
-from typing import Dict, List, Optional, Callable
+import heapq
+from operator import attrgetter
+from typing import Dict, List, Optional, Callable, Iterable, Tuple
 from datetime import datetime
 from ..models.player import Player, Achievement, Challenge, Skill
 
+# Engine events an achievement rule can be bound to
+RULE_TRIGGERS = frozenset(
+    ('any', 'experience_gained', 'level_up', 'challenge_completed')
+)
+
 
 class AchievementRule:
     """
     Defines a rule for earning an achievement.
 
     Uses strategy pattern for flexible achievement conditions.
+
+    ``triggers`` names the engine events after which the rule can newly be
+    satisfied ('experience_gained', 'level_up', 'challenge_completed').
+    The default 'any' checks the rule after every event. 'level_up' rules
+    are also rechecked when points from achievements earned during a check
+    level the player up; other rules see such changes on the next event.
     """
 
+    __slots__ = ('achievement', 'condition', 'description', 'triggers')
+
     def __init__(
         self,
         achievement: Achievement,
         condition: Callable[[Player], bool],
-        description: str = ""
+        description: str = "",
+        triggers: Iterable[str] = ('any',)
     ):
         self.achievement = achievement
         self.condition = condition
         self.description = description
+        if isinstance(triggers, str):
+            raise ValueError(
+                f"triggers must be a collection of event names, not {triggers!r}"
+            )
+        self.triggers = frozenset(triggers)
+        unknown = self.triggers - RULE_TRIGGERS
+        if unknown:
+            raise ValueError(f"Unknown achievement triggers: {sorted(unknown)}")
 
     def check(self, player: Player) -> bool:
         """Check if player meets the condition for this achievement."""
@@ -38,15 +62,30 @@ class GameEngine:
     Uses OOP to maintain game state and orchestrate player interactions.
     """
 
+    __slots__ = (
+        '_players', '_achievement_rules', '_rules_by_triggers',
+        '_challenge_catalog', '_level_up_listeners',
+        '_achievement_earned_listeners', '_challenge_completed_listeners'
+    )
+
+    # Attribute holding the listener tuple for each event
+    _LISTENER_ATTRS = {
+        'level_up': '_level_up_listeners',
+        'achievement_earned': '_achievement_earned_listeners',
+        'challenge_completed': '_challenge_completed_listeners'
+    }
+
     def __init__(self):
         self._players: Dict[str, Player] = {}
         self._achievement_rules: List[AchievementRule] = []
+        # Rules to check per trigger combination, in registration order
+        self._rules_by_triggers: Dict[Tuple[str, ...], List[AchievementRule]] = {}
         self._challenge_catalog: Dict[str, Challenge] = {}
-        self._event_listeners: Dict[str, List[Callable]] = {
-            'level_up': [],
-            'achievement_earned': [],
-            'challenge_completed': []
-        }
+        # Listeners are bound per event as tuples that are replaced, not
+        # mutated, on subscription, so firing never needs a defensive copy
+        self._level_up_listeners: Tuple[Callable, ...] = ()
+        self._achievement_earned_listeners: Tuple[Callable, ...] = ()
+        self._challenge_completed_listeners: Tuple[Callable, ...] = ()
 
     def register_player(self, player_id: str, username: str) -> Player:
         """Register a new player in the game."""
@@ -64,6 +103,7 @@ class GameEngine:
     def add_achievement_rule(self, rule: AchievementRule) -> None:
         """Add a new achievement rule to the engine."""
         self._achievement_rules.append(rule)
+        self._rules_by_triggers.clear()
 
     def add_challenge(self, challenge: Challenge) -> None:
         """Add a challenge to the catalog."""
@@ -92,13 +132,22 @@ class GameEngine:
             return False
 
         # Complete the challenge
+        level = player.level
         success = player.complete_challenge(challenge_id)
         if success:
             # Trigger event listeners
-            self._trigger_event('challenge_completed', player, challenge_id)
+            for listener in self._challenge_completed_listeners:
+                listener(player, challenge_id)
 
             # Check for new achievements
-            self._check_achievements(player)
+            if player.level > level:
+                self._check_achievements(
+                    player, 'challenge_completed', 'experience_gained', 'level_up'
+                )
+            else:
+                self._check_achievements(
+                    player, 'challenge_completed', 'experience_gained'
+                )
 
         return success
 
@@ -115,45 +164,63 @@ class GameEngine:
 
         leveled_up = player.add_experience(amount)
         if leveled_up:
-            self._trigger_event('level_up', player)
+            for listener in self._level_up_listeners:
+                listener(player)
 
         # Check for achievements after experience gain
-        self._check_achievements(player)
+        if leveled_up:
+            self._check_achievements(player, 'experience_gained', 'level_up')
+        else:
+            self._check_achievements(player, 'experience_gained')
 
         return leveled_up
 
-    def _check_achievements(self, player: Player) -> List[Achievement]:
+    def _rules_for(self, triggers: Tuple[str, ...]) -> List[AchievementRule]:
+        """Rules bound to any of the given triggers, in registration order."""
+        rules = self._rules_by_triggers.get(triggers)
+        if rules is None:
+            rules = [
+                rule for rule in self._achievement_rules
+                if not rule.triggers.isdisjoint(triggers)
+            ]
+            self._rules_by_triggers[triggers] = rules
+        return rules
+
+    def _check_achievements(
+        self,
+        player: Player,
+        *triggers: str
+    ) -> List[Achievement]:
         """
-        Check all achievement rules for a player and award new achievements.
+        Check the achievement rules relevant to the given triggers (plus
+        every 'any' rule) for a player and award new achievements.
 
         Returns:
             List of newly earned achievements.
         """
         new_achievements = []
 
-        for rule in self._achievement_rules:
-            # Check if player already has this achievement
-            has_achievement = any(
-                a.id == rule.achievement.id for a in player.achievements
-            )
-
-            if not has_achievement and rule.check(player):
-                player.earn_achievement(rule.achievement)
-                new_achievements.append(rule.achievement)
-                self._trigger_event('achievement_earned', player, rule.achievement)
-
-        return new_achievements
+        rules = self._rules_for(('any',) + triggers)
+        while True:
+            level = player.level
+            for rule in rules:
+                if not player.has_achievement(rule.achievement.id) and rule.check(player):
+                    player.earn_achievement(rule.achievement)
+                    new_achievements.append(rule.achievement)
+                    for listener in self._achievement_earned_listeners:
+                        listener(player, rule.achievement)
+
+            # Points from the achievements just earned can level the player
+            # up; recheck the 'level_up' rules until the level settles
+            if player.level == level:
+                return new_achievements
+            rules = self._rules_for(('level_up',))
 
     def on(self, event: str, listener: Callable) -> None:
         """Register an event listener."""
-        if event in self._event_listeners:
-            self._event_listeners[event].append(listener)
-
-    def _trigger_event(self, event: str, *args, **kwargs) -> None:
-        """Trigger all listeners for an event."""
-        if event in self._event_listeners:
-            for listener in self._event_listeners[event]:
-                listener(*args, **kwargs)
+        attr = self._LISTENER_ATTRS.get(event)
+        if attr is not None:
+            setattr(self, attr, getattr(self, attr) + (listener,))
 
     def get_leaderboard(self, top_n: int = 10) -> List[Dict]:
         """
@@ -162,10 +229,10 @@ class GameEngine:
         Returns:
             List of player summaries sorted by points.
         """
-        sorted_players = sorted(
+        top_players = heapq.nlargest(
+            top_n,
             self._players.values(),
-            key=lambda p: p.total_points,
-            reverse=True
+            key=attrgetter('total_points')
         )
 
         return [
@@ -173,7 +240,7 @@ class GameEngine:
                 'rank': idx + 1,
                 **player.get_progress_summary()
             }
-            for idx, player in enumerate(sorted_players[:top_n])
+            for idx, player in enumerate(top_players)
         ]
 
     def get_stats(self) -> Dict:
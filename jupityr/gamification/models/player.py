@@ -4,11 +4,16 @@ Player model for gamified learning environment.
 Uses OOP principles for state management and behavior encapsulation.
 """
 
+import sys
+import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Set
 from datetime import datetime
 from enum import Enum
 
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class Skill(Enum):
     """Player skill categories."""
@@ -18,7 +23,7 @@ class Skill(Enum):
     PROGRAMMING = "programming"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Achievement:
     """Represents an achievement earned by a player."""
     id: str
@@ -30,7 +35,7 @@ class Achievement:
     metadata: Dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Challenge:
     """Represents a learning challenge."""
     id: str
@@ -51,6 +56,12 @@ class Player:
     progression, achievements, and skill tracking.
     """
 
+    __slots__ = (
+        'player_id', 'username', 'level', 'experience', 'total_points',
+        '_achievements', '_achievement_ids', '_challenges', '_skill_levels',
+        'created_at', '_last_active'
+    )
+
     def __init__(self, player_id: str, username: str):
         self.player_id = player_id
         self.username = username
@@ -58,16 +69,31 @@ class Player:
         self.experience = 0
         self.total_points = 0
         self._achievements: List[Achievement] = []
+        self._achievement_ids: Set[str] = set()
         self._challenges: Dict[str, Challenge] = {}
         self._skill_levels: Dict[Skill, int] = {skill: 0 for skill in Skill}
         self.created_at = datetime.now()
-        self.last_active = datetime.now()
+        # Stored as a POSIX timestamp; set on every XP gain, read rarely
+        self._last_active = self.created_at.timestamp()
+
+    @property
+    def last_active(self) -> datetime:
+        """Time of the player's most recent activity."""
+        return datetime.fromtimestamp(self._last_active)
+
+    @last_active.setter
+    def last_active(self, value: datetime) -> None:
+        self._last_active = value.timestamp()
 
     @property
     def achievements(self) -> List[Achievement]:
         """Get all earned achievements."""
         return self._achievements.copy()
 
+    def has_achievement(self, achievement_id: str) -> bool:
+        """Check whether the player has earned an achievement."""
+        return achievement_id in self._achievement_ids
+
     @property
     def active_challenges(self) -> List[Challenge]:
         """Get all active (incomplete) challenges."""
@@ -86,7 +112,7 @@ class Player:
             True if player leveled up, False otherwise.
         """
         self.experience += amount
-        self.last_active = datetime.now()
+        self._last_active = time.time()
 
         # Level up formula: 100 * level for next level
         required_exp = 100 * self.level
@@ -98,8 +124,9 @@ class Player:
 
     def earn_achievement(self, achievement: Achievement) -> None:
         """Award an achievement to the player."""
-        if achievement.id not in {a.id for a in self._achievements}:
+        if achievement.id not in self._achievement_ids:
             self._achievements.append(achievement)
+            self._achievement_ids.add(achievement.id)
             self.total_points += achievement.points
             self.add_experience(achievement.points)
 
@@ -136,14 +163,16 @@ class Player:
 
     def get_progress_summary(self) -> Dict:
         """Get a summary of player progress."""
+        # One pass over the challenges, without building either filtered list
+        completed = sum(c.completed for c in self._challenges.values())
         return {
             'username': self.username,
             'level': self.level,
             'experience': self.experience,
             'total_points': self.total_points,
             'achievements_count': len(self._achievements),
-            'completed_challenges': len(self.completed_challenges),
-            'active_challenges': len(self.active_challenges),
+            'completed_challenges': completed,
+            'active_challenges': len(self._challenges) - completed,
             'skills': {skill.value: level for skill, level in self._skill_levels.items()},
             'days_active': (datetime.now() - self.created_at).days
         }
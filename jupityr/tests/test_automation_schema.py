@@ -0,0 +1,64 @@
+"""Tests for the declarative automation schema."""
+
+import pytest
+
+from jupityr.config.loader import ConfigLoader
+from jupityr.config.schemas.automation_schema import (
+    Condition, TriggerConfig, TriggerType
+)
+
+
+@pytest.mark.parametrize('operator, expected, actual, result', [
+    ('eq', 3, 3, True),
+    ('ne', 3, 3, False),
+    ('gt', 3, 4, True),
+    ('lt', 3, 4, False),
+    ('gte', 3, 3, True),
+    ('lte', 3, 2, True),
+    ('in', ['a', 'b'], 'a', True),
+    ('in', ['a', 'b'], 'c', False),
+    ('contains', 'b', ['a', 'b'], True),
+])
+def test_condition_evaluate(operator, expected, actual, result):
+    """Each operator compares the context value against the condition."""
+    condition = Condition(field='count', operator=operator, value=expected)
+
+    assert condition.evaluate({'count': actual}) is result
+
+
+def test_trigger_conditions_met():
+    """A trigger fires only when every condition holds."""
+    trigger = TriggerConfig(
+        type=TriggerType.THRESHOLD,
+        config={},
+        conditions=[
+            Condition(field='count', operator='gte', value=10),
+            Condition(field='status', operator='eq', value='ready'),
+        ]
+    )
+
+    assert trigger.conditions_met({'count': 12, 'status': 'ready'})
+    assert not trigger.conditions_met({'count': 12, 'status': 'busy'})
+    assert TriggerConfig(type=TriggerType.MANUAL, config={}).conditions_met({})
+
+
+def test_unknown_operator_is_rejected(tmp_path):
+    """Rules with an unknown operator fail at load time."""
+    with pytest.raises(ValueError):
+        Condition(field='count', operator='between', value=(1, 2))
+
+    path = tmp_path / 'rule.json'
+    ConfigLoader.save_file({
+        'id': 'rule',
+        'name': 'rule',
+        'description': '',
+        'trigger': {
+            'type': 'threshold',
+            'conditions': [
+                {'field': 'count', 'operator': 'between', 'value': [1, 2]}
+            ]
+        },
+        'actions': []
+    }, path)
+    with pytest.raises(ValueError, match='between'):
+        ConfigLoader.load_automation_rule(path)
@@ -0,0 +1,83 @@
+"""Tests for the declarative configuration loader."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from jupityr.config.loader import ConfigLoader
+
+EXAMPLES = Path(__file__).resolve().parents[2] / 'examples'
+
+
+def test_loaded_rules_do_not_share_state():
+    """Mutating a loaded rule does not leak into later loads."""
+    path = EXAMPLES / 'automation_example.yaml'
+
+    first = ConfigLoader.load_automation_rule(path)
+    first.execution_count += 1
+    first.enabled = False
+    first.tags.append('mutated')
+
+    second = ConfigLoader.load_automation_rule(path)
+    assert second is not first
+    assert second.execution_count == 0
+    assert second.enabled
+    assert 'mutated' not in second.tags
+
+
+def test_loaded_configs_do_not_share_state():
+    """Mutating a loaded config dict does not leak into later loads."""
+    path = EXAMPLES / 'corpus_example.yaml'
+
+    first = ConfigLoader.load_file(path)
+    first['tags'].append('mutated')
+    first['name'] = 'changed'
+
+    second = ConfigLoader.load_file(path)
+    assert 'mutated' not in second['tags']
+    assert second['name'] != 'changed'
+
+
+def test_format_follows_given_suffix_through_symlink(tmp_path):
+    """A .yaml symlink is parsed as YAML whatever its target is named."""
+    target = tmp_path / 'real.txt'
+    target.write_text('name: corpus\ntags: [a, b]\n', encoding='utf-8')
+    link = tmp_path / 'cfg.yaml'
+    link.symlink_to(target)
+
+    assert ConfigLoader.load_file(link) == {'name': 'corpus', 'tags': ['a', 'b']}
+
+
+def test_rewrite_with_same_mtime_is_not_stale(tmp_path):
+    """A quick rewrite that keeps the mtime is still picked up."""
+    path = tmp_path / 'cfg.yaml'
+    ConfigLoader.save_file({'name': 'first'}, path)
+    mtime_ns = path.stat().st_mtime_ns
+    assert ConfigLoader.load_file(path) == {'name': 'first'}
+
+    ConfigLoader.save_file({'name': 'second, longer'}, path)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    assert ConfigLoader.load_file(path) == {'name': 'second, longer'}
+
+
+def test_json_round_trip(tmp_path):
+    """JSON configs load straight from disk."""
+    path = tmp_path / 'cfg.json'
+    ConfigLoader.save_file({'name': 'corpus', 'tags': ['a']}, path)
+
+    assert ConfigLoader.load_file(path) == {'name': 'corpus', 'tags': ['a']}
+
+
+def test_missing_and_unsupported_files(tmp_path):
+    """Missing files and unknown suffixes raise the documented errors."""
+    with pytest.raises(FileNotFoundError):
+        ConfigLoader.load_file(tmp_path / 'missing.yaml')
+    with pytest.raises(FileNotFoundError):
+        ConfigLoader.load_file(tmp_path / 'missing.json')
+
+    path = tmp_path / 'cfg.txt'
+    path.write_text('name: corpus\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        ConfigLoader.load_file(path)
@@ -0,0 +1,115 @@
+"""Tests for the gamification engine."""
+
+import pytest
+
+from jupityr.gamification.engine.game_engine import AchievementRule, GameEngine
+from jupityr.gamification.models.player import Achievement
+
+
+def make_achievement(achievement_id: str, points: int = 0) -> Achievement:
+    return Achievement(
+        id=achievement_id,
+        name=achievement_id,
+        description='',
+        category='test',
+        points=points
+    )
+
+
+def test_rule_rejects_bare_string_triggers():
+    """A single trigger name must be wrapped in a collection."""
+    with pytest.raises(ValueError):
+        AchievementRule(make_achievement('a'), bool, triggers='level_up')
+
+
+def test_rule_rejects_unknown_triggers():
+    """Misspelled trigger names are rejected instead of never firing."""
+    with pytest.raises(ValueError):
+        AchievementRule(make_achievement('a'), bool, triggers=('levelup',))
+
+
+def test_rules_only_run_for_their_triggers():
+    """Rules bound to other events are skipped."""
+    engine = GameEngine()
+    engine.register_player('p', 'player')
+    calls = []
+    engine.add_achievement_rule(AchievementRule(
+        make_achievement('done'),
+        lambda player: calls.append('done'),
+        triggers=('challenge_completed',)
+    ))
+
+    engine.award_experience('p', 10)
+
+    assert calls == []
+
+
+def test_rules_run_once_in_registration_order():
+    """A rule under several fired triggers is checked once, in order."""
+    engine = GameEngine()
+    engine.register_player('p', 'player')
+    calls = []
+    for name, triggers in [
+        ('both', ('experience_gained', 'level_up')),
+        ('any', ('any',)),
+        ('level', ('level_up',)),
+    ]:
+        engine.add_achievement_rule(AchievementRule(
+            make_achievement(name),
+            lambda player, name=name: calls.append(name),
+            triggers=triggers
+        ))
+
+    assert engine.award_experience('p', 100)
+
+    assert calls == ['both', 'any', 'level']
+
+
+def test_level_up_from_achievement_points_rechecks_level_up_rules():
+    """Level-ups caused by achievement points still run 'level_up' rules."""
+    engine = GameEngine()
+    player = engine.register_player('p', 'player')
+    engine.add_achievement_rule(AchievementRule(
+        make_achievement('level3'),
+        lambda player: player.level >= 3,
+        triggers=('level_up',)
+    ))
+    engine.add_achievement_rule(AchievementRule(
+        make_achievement('level2', points=200),
+        lambda player: player.level >= 2,
+        triggers=('level_up',)
+    ))
+    engine.add_achievement_rule(AchievementRule(
+        make_achievement('first_xp', points=150),
+        lambda player: True,
+        triggers=('experience_gained',)
+    ))
+
+    assert not engine.award_experience('p', 1)
+
+    assert player.level == 3
+    assert player.has_achievement('level2')
+    assert player.has_achievement('level3')
+
+
+def test_any_rules_are_checked_once_per_event():
+    """Default rules keep a single pass per event."""
+    engine = GameEngine()
+    player = engine.register_player('p', 'player')
+    engine.add_achievement_rule(AchievementRule(
+        make_achievement('level2'), lambda player: player.level >= 2
+    ))
+    engine.add_achievement_rule(AchievementRule(
+        make_achievement('xp50', points=200),
+        lambda player: player.experience >= 50
+    ))
+
+    engine.award_experience('p', 60)
+
+    assert player.level == 2
+    assert player.has_achievement('xp50')
+    assert not player.has_achievement('level2')
+
+    engine.award_experience('p', 0)
+
+    assert player.has_achievement('level2')
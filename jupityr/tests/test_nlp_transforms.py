@@ -0,0 +1,109 @@
+"""Tests for functional NLP transformations."""
+
+import pickle
+import warnings
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from jupityr.core.nlp.transforms import (
+    basic_clean, batch_transform, ngram_counts, ngrams
+)
+
+TEXTS = ['Hello,  World!', "It's a well-known fact.", 'A b; c'] * 20
+
+
+def test_basic_clean_pickles_and_matches():
+    """basic_clean survives a pickle round trip for process pools."""
+    restored = pickle.loads(pickle.dumps(basic_clean))
+
+    assert restored('Hello,  World!') == basic_clean('Hello,  World!')
+    assert basic_clean("It's a  well-known FACT.") == "it's a well-known fact"
+
+
+def test_batch_transform_process_pool():
+    """Picklable transforms run in a process pool without warnings."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        batch = batch_transform(basic_clean, n_process=2, chunk_size=8)
+
+        assert batch(TEXTS) == [basic_clean(text) for text in TEXTS]
+
+
+def test_batch_transform_serial_fallback():
+    """Unpicklable transforms warn and fall back to serial processing."""
+    with pytest.warns(RuntimeWarning, match='<lambda> cannot be pickled'):
+        batch = batch_transform(lambda text: text.upper(), n_process=2)
+
+    assert batch(['a', 'b']) == ['A', 'B']
+
+
+@pytest.mark.parametrize('n_process', [None, 1, 2, -1])
+def test_batch_transform_threaded(n_process):
+    """Thread pools keep input order and need no pickling."""
+    batch = batch_transform(
+        lambda text: text.upper(), n_process=n_process, threaded=True
+    )
+
+    assert batch(TEXTS) == [text.upper() for text in TEXTS]
+
+
+@pytest.mark.parametrize('n_process', [0, -2])
+def test_batch_transform_rejects_invalid_n_process(n_process):
+    """Invalid worker counts fail when the batch function is built."""
+    with pytest.raises(ValueError):
+        batch_transform(basic_clean, n_process=n_process)
+
+
+def _reference_counts(ids, n):
+    """(grams, counts) computed from Counter(ngrams(...)) for comparison."""
+    counted = sorted(Counter(ngrams(list(ids), n)).items())
+    return [list(gram) for gram, _ in counted], [count for _, count in counted]
+
+
+def assert_counts_match(ids, n):
+    grams, counts = ngram_counts(ids, n)
+    expected_grams, expected_counts = _reference_counts(ids, n)
+
+    assert grams.tolist() == expected_grams
+    assert counts.tolist() == expected_counts
+    assert grams.dtype == np.asarray(ids).dtype
+
+
+def test_ngram_counts_uint64_near_int64_max():
+    """Large unsigned IDs are packed without float64 key collisions."""
+    ids = np.array(
+        [2**20, 5, 2**20, 5, 2**20 + 1, 2**62, 2**63 - 1, 2**63 + 5],
+        dtype=np.uint64
+    )
+
+    for n in (1, 2, 3):
+        assert_counts_match(ids, n)
+    assert_counts_match(
+        np.array([2**20, 5, 2**20, 5, 2**20 + 1], dtype=np.uint64), 3
+    )
+
+
+def test_ngram_counts_negative_ids():
+    """Negative IDs take the np.unique fallback."""
+    assert_counts_match(np.array([-1, 2, -1, 2, 3, -1]), 2)
+
+
+def test_ngram_counts_key_overflow():
+    """Windows whose packed keys would overflow int64 still count exactly."""
+    ids = np.array([10**6, 1, 10**6, 1, 2, 10**6] * 3, dtype=np.int64)
+
+    assert (10**6 + 1) ** 4 > np.iinfo(np.int64).max
+    assert_counts_match(ids, 4)
+
+
+def test_ngram_counts_small_inputs():
+    """Empty and too-short inputs yield no n-grams."""
+    grams, _ = ngram_counts(np.array([], dtype=np.int64), 2)
+    assert grams.shape == (0, 2)
+
+    assert_counts_match(np.array([], dtype=np.int64), 2)
+
+    assert_counts_match(np.array([1, 2], dtype=np.int32), 3)
+    assert_counts_match(np.array([7, 7, 7], dtype=np.int32), 3)
@@ -0,0 +1,60 @@
+"""Tests for functional ML transformations."""
+
+import numpy as np
+
+from jupityr.core.ml.transformers import (
+    compose_transforms, learn_transform, min_max_scale, normalize
+)
+
+
+def test_normalize_large_mean_small_variance():
+    """Statistics stay accurate when the mean dwarfs the spread."""
+    rng = np.random.default_rng(0)
+    data = 1e9 + rng.standard_normal((1000, 3))
+
+    transform = learn_transform(data, normalize)
+
+    np.testing.assert_allclose(transform.params['mean'], data.mean(axis=0))
+    np.testing.assert_allclose(
+        transform.params['std'], data.std(axis=0), rtol=1e-6
+    )
+    result = normalize(data)
+    np.testing.assert_allclose(result.mean(axis=0), 0.0, atol=1e-6)
+    np.testing.assert_allclose(result.std(axis=0), 1.0, rtol=1e-6)
+
+
+def _sequential(transforms, data):
+    result = data
+    for transform in transforms:
+        result = transform(result)
+    return result
+
+
+def test_fused_chain_matches_sequential():
+    """A fused normalize/min_max chain gives the step-by-step result."""
+    rng = np.random.default_rng(1)
+    data = rng.normal(5.0, 3.0, (500, 4))
+    norm = learn_transform(data, normalize)
+    scale = learn_transform(norm(data), min_max_scale)
+
+    fused = compose_transforms(norm, scale)
+
+    np.testing.assert_allclose(
+        fused(data), _sequential([norm, scale], data), rtol=1e-12, atol=1e-12
+    )
+
+
+def test_fused_chain_float32_large_offset():
+    """float32 data far from zero does not lose precision when fused."""
+    rng = np.random.default_rng(2)
+    data = (1e4 + rng.standard_normal((1000, 3))).astype(np.float32)
+    norm = learn_transform(data, normalize)
+    scale = learn_transform(norm(data), min_max_scale)
+    expected = _sequential([norm, scale], data.astype(np.float64))
+
+    result = compose_transforms(norm, scale)(data)
+    sequential = _sequential([norm, scale], data)
+
+    assert result.dtype == np.float32
+    sequential_error = np.abs(sequential - expected).max()
+    assert np.abs(result - expected).max() <= max(2 * sequential_error, 1e-6)